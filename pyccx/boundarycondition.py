@@ -36,7 +36,7 @@ class BoundaryCondition(abc.ABC):
     def getBoundaryFaces(self):
 
         if isinstance(self.target, SurfaceSet):
-            return self.target.nodes
+            return self.target.surfacePairs
 
         return None
 
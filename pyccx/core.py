@@ -2,11 +2,13 @@
 
 
 import re  # used to get info from frd file
+import io
+import itertools
 import os
 import sys
 import subprocess  # used to check ccx version
 from enum import Enum, auto
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import logging
 
 from .mesh import Mesher
@@ -15,6 +17,26 @@ from .results import ResultProcessor
 import gmsh
 import numpy as np
 
+try:
+    # Numba is optional and is used to accelerate formatting of very large node and element sets
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+
+# Section banners written to the input deck
+_HDR_INCLUDES = os.linesep + '{:*^125}\n'.format(' INCLUDES ')
+_HDR_ELEMENT_SETS = os.linesep + '{:*^125}\n'.format(' ELEMENT SETS ')
+_HDR_NODE_SETS = os.linesep + '{:*^125}\n'.format(' NODE SETS ')
+_HDR_CONNECTORS = os.linesep + '{:*^125}\n'.format(' KINEMATIC CONNECTORS ')
+_HDR_MPCS = os.linesep + '{:*^125}\n'.format(' MPCS ')
+_HDR_MATERIAL_ASSIGNMENTS = os.linesep + '{:*^125}\n'.format(' MATERIAL ASSIGNMENTS ')
+_HDR_MATERIALS = os.linesep + '{:*^125}\n'.format(' MATERIALS ')
+_HDR_INITIAL_CONDITIONS = os.linesep + '{:*^125}\n'.format(' INITIAL CONDITIONS ')
+_HDR_ANALYSIS_CONDITIONS = os.linesep + '{:*^125}\n'.format(' ANALYSIS CONDITIONS ')
+_HDR_LOAD_STEPS = os.linesep + '{:*^125}\n'.format(' LOAD STEPS ')
+
 
 class AnalysisError(Exception):
     """Exception raised for errors generated during the analysis
@@ -35,11 +57,214 @@ class AnalysisType(Enum):
     FLUID = auto()
 
 
+_NUMBA_MIN_SIZE = 100000
+""" Minimum size of an integer array before formatting is performed using the Numba kernel """
+
+
+if _HAS_NUMBA:
+
+    @njit(cache=True, parallel=True)
+    def _formatIntsAscii(arr, terminate):
+        """
+        Formats a 1D int64 array into comma separated ASCII data, returned as a uint8 buffer. Entries flagged in
+        terminate end the data line. The length of each entry is found first so that the digits may be written in
+        parallel. The character offsets for each entry in the buffer are also returned.
+        """
+        n = arr.size
+        lengths = np.empty(n, np.int64)
+
+        for i in prange(n):
+            val = arr[i]
+            numChars = 2 if val < 0 else 1  # First digit and sign
+
+            val = abs(val)
+            while val >= 10:
+                val //= 10
+                numChars += 1
+
+            lengths[i] = numChars + 1  # Separator
+
+        offsets = np.zeros(n + 1, np.int64)
+        offsets[1:] = np.cumsum(lengths)
+
+        buf = np.empty(offsets[n], np.uint8)
+
+        for i in prange(n):
+            end = offsets[i + 1] - 1
+
+            # Terminate the data line with a newline, otherwise use a comma
+            if terminate[i]:
+                buf[end] = 10
+            else:
+                buf[end] = 44
+
+            val = abs(arr[i])
+            pos = end - 1
+
+            while True:
+                buf[pos] = 48 + val % 10
+                val //= 10
+                pos -= 1
+
+                if val == 0:
+                    break
+
+            if arr[i] < 0:
+                buf[pos] = 45
+
+        return buf, offsets
+
+
+def _lineTerminators(sizes: np.ndarray, perLine: int) -> np.ndarray:
+    """
+    Returns a boolean mask over the concatenated entries of consecutive sets, flagging the entries which end a data
+    line i.e. every perLine entries within a set and the last entry of each set.
+
+    :param sizes: Number of entries in each set
+    :param perLine: int: Number of entries written per data line
+    :return: np.ndarray: Boolean mask for each entry
+    """
+    ends = np.cumsum(sizes)
+    starts = np.repeat(ends - sizes, sizes)
+
+    terminate = (np.arange(ends[-1] if len(ends) else 0) - starts + 1) % perLine == 0
+    terminate[ends[sizes > 0] - 1] = True
+
+    return terminate
+
+
+def _writeIntArray(out, arr, perLine: int = 16) -> None:
+    """
+    Writes an integer array (e.g. node or element IDs) as comma separated data lines to a text stream. Calculix
+    permits at most 16 entries per line for set definitions.
+
+    :param out: Text stream to write to
+    :param arr: Array of integer values
+    :param perLine: int: Number of entries written per data line
+    """
+    arr = np.asarray(arr).ravel()
+
+    if _HAS_NUMBA and arr.size >= _NUMBA_MIN_SIZE:
+        buf, _ = _formatIntsAscii(np.ascontiguousarray(arr, dtype=np.int64),
+                                  _lineTerminators(np.array([arr.size]), perLine))
+        out.write(buf.tobytes().decode('ascii'))
+        return
+
+    # Full rows are formatted in a single pass, with any remainder written as the final line
+    numFull = (arr.size // perLine) * perLine
+
+    if numFull > 0:
+        np.savetxt(out, arr[:numFull].reshape(-1, perLine), fmt='%d', delimiter=',')
+
+    if numFull < arr.size:
+        out.write(','.join(map(str, arr[numFull:].tolist())))
+        out.write('\n')
+
+
+class _PackedSets:
+    """
+    Structure-of-arrays representation of a collection of node or element sets used when writing the input deck.
+    The IDs of all the sets are stored within a single contiguous array, where the IDs of set i are found between
+    offsets[i] and offsets[i+1]. This is only used for the numba formatting path.
+    """
+    def __init__(self, keywords: List[str], arrays):
+
+        arrays = [np.asarray(arr).ravel() for arr in arrays]
+
+        self.keywords = keywords
+        self.sizes = np.array([arr.size for arr in arrays], dtype=np.int64)
+
+        self.offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        self.offsets[1:] = np.cumsum(self.sizes)
+
+        if len(arrays) > 0:
+            self.ids = np.concatenate(arrays).astype(np.int64, copy=False)
+        else:
+            self.ids = np.empty(0, dtype=np.int64)
+
+    def writeInput(self, out, perLine: int = 16) -> None:
+        """
+        Writes each set with its keyword line followed by the data lines containing the IDs. The IDs across all sets
+        are formatted in a single pass.
+
+        :param out: Text stream to write to
+        :param perLine: int: Number of entries written per data line
+        """
+
+        buf, charOffsets = _formatIntsAscii(self.ids, _lineTerminators(self.sizes, perLine))
+        bounds = charOffsets[self.offsets]
+
+        for i, keyword in enumerate(self.keywords):
+            out.write(os.linesep)
+            out.write(keyword)
+            out.write(buf[bounds[i]:bounds[i + 1]].tobytes().decode('ascii'))
+
+
+def _writeSets(out, sets, baseCls, ids) -> None:
+    """
+    Writes a list of node or element sets, each preceded by a blank line. A large collection of sets which all use
+    the default writer of baseCls is packed and formatted together using numba, otherwise each set writes itself.
+
+    :param out: Text stream to write to
+    :param sets: The node or element sets to write
+    :param baseCls: The set class providing the default writer and keyword
+    :param ids: Function returning the IDs of a set
+    """
+
+    if _HAS_NUMBA and all(type(s).writeInput is baseCls.writeInput for s in sets):
+
+        if sum(np.size(ids(s)) for s in sets) >= _NUMBA_MIN_SIZE:
+            packed = _PackedSets([s.keyword.format(s.name) for s in sets], [ids(s) for s in sets])
+            packed.writeInput(out)
+            return
+
+    for s in sets:
+        out.write(os.linesep)
+        s.writeInput(out)
+
+
+_meshFileOwners = {}
+""" The mesh cache key of the analysis which last wrote each mesh file, indexed by the absolute file path """
+
+
+def _fileState(path: str):
+    """
+    Returns the modification time and size of a file, used to detect if it has been changed since it was written
+
+    :param path: str: The file path
+    :return: The (modification time, size) of the file or None if it does not exist
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _equationFormat(numTerms: int) -> str:
+    """
+    Builds the row format used by np.savetxt for writing *EQUATION cards. Each row consists of the number of terms
+    followed by the (node, dof, coefficient) terms, with a maximum of 4 terms (12 entries) per line as required by Calculix.
+
+    :param numTerms: int: Number of terms in the equation
+    :return: str: The row format
+    """
+    termFmts = ['%d,%d,%e'] * numTerms
+    lines = [','.join(termFmts[i:i + 4]) for i in range(0, numTerms, 4)]
+
+    return '{:d}\n'.format(numTerms) + '\n'.join(lines)
+
+
 class NodeSet:
     """
      An node set is basic entity for storing node set lists. The set remains constant without any dynamic referencing
      to any underlying geometric entities.
      """
+
+    keyword = '*NSET,NSET={:s}\n'
+    """ Format of the keyword line of the set given its name """
+
     def __init__(self, name, nodes):
         self.name = name
         self._nodes = nodes
@@ -55,10 +280,9 @@ class NodeSet:
     def nodes(self, nodes):
         self._nodes = nodes
 
-    def writeInput(self) -> str:
-        out = '*NSET,NSET={:s}\n'.format(self.name)
-        out += np.array2string(self.nodes, precision=2, separator=', ', threshold=9999999999)[1:-1]
-        return out
+    def writeInput(self, out) -> None:
+        out.write(self.keyword.format(self.name))
+        _writeIntArray(out, self.nodes)
 
 
 class ElementSet:
@@ -66,6 +290,10 @@ class ElementSet:
     An element set is basic entity for storing element set lists.The set remains constant without any dynamic referencing
      to any underlying geometric entities.
     """
+
+    keyword = '*ELSET,ELSET={:s}\n'
+    """ Format of the keyword line of the set given its name """
+
     def __init__(self, name, els):
         self.name =  name
         self._els = els
@@ -81,11 +309,10 @@ class ElementSet:
     def els(self, elements):
         self._els = elements
 
-    def writeInput(self) -> str:
+    def writeInput(self, out) -> None:
 
-        out = '*ELSET,ELSET={:s\n}'.format(self.name)
-        out += np.array2string(self.els, precision=2, separator=', ', threshold=9999999999)[1:-1]
-        return out
+        out.write(self.keyword.format(self.name))
+        _writeIntArray(out, self.els)
 
 
 class SurfaceSet:
@@ -104,21 +331,21 @@ class SurfaceSet:
         Elements with the associated face orientations are specified as Nx2 numpy array, with the first column being
         the element Id, and the second column the chosen face orientation
         """
-        return self._els
+        return self._elSurfacePairs
 
     @surfacePairs.setter
-    def els(self, surfacePairs):
+    def surfacePairs(self, surfacePairs):
         self._elSurfacePairs = surfacePairs
 
-    def writeInput(self) -> str:
+    def writeInput(self, out) -> None:
 
-        out = '*SURFACE,NAME={:s}\n'.format(self.name)
+        out.write('*SURFACE,NAME={:s}\n'.format(self.name))
 
-        for i in range(self._elSurfacePairs.shape[0]):
-            out += '{:d},S{:d}\n'.format(self._elSurfacePairs[i,0], self._elSurfacePairs[i,1])
+        write = out.write
+        faceFmt = '{:d},S{:d}\n'.format
 
-        out += np.array2string(self.els, precision=2, separator=', ', threshold=9999999999)[1:-1]
-        return out
+        for elId, faceId in np.asarray(self._elSurfacePairs)[:, :2].tolist():
+            write(faceFmt(elId, faceId))
 
 
 class Connector:
@@ -130,6 +357,8 @@ class Connector:
         self._refNode = refNode
         self._nodeset = None
 
+        self.nodeset = nodes
+
     @property
     def refNode(self):
         """
@@ -159,17 +388,15 @@ class Connector:
             raise ValueError('Invalid type for nodes passed to Connector()')
 
 
-    def writeInput(self) -> str:
+    def writeInput(self, out) -> None:
         # A nodeset is automatically created from the name of the connector
-        strOut = '*RIGIDBODY, NSET={:s}'.format(self.nodeset.name)
+        out.write('*RIGIDBODY, NSET={:s}'.format(self.nodeset.name))
 
         # A reference node is optional
-        if isinstance(self.redNode, int):
-            strOut += ',REF NODE={:d}\n'.format(self.refNode)
+        if isinstance(self.refNode, int):
+            out.write(',REF NODE={:d}\n'.format(self.refNode))
         else:
-            strOut += '\n'
-
-        return strOut
+            out.write('\n')
 
 
 class DOF:
@@ -226,11 +453,18 @@ class Simulation:
         self.elSets = []
         self.includes = []
 
+        # Cached state used to avoid regenerating unchanged parts of the input deck between runs
+        self._meshCacheKey = None
+        self._meshFileState = None
+        self._materialsCacheKey = None
+        self._materialsCache = ''
+        self._validMaterialsKey = None
+
     def init(self):
 
-        self._input = ''
-        self._nodeSets = self.nodeSets
-        self._elSets = self.elSets
+        # Copies are taken so that sets generated during writing (e.g. connectors) are not added to the user's sets
+        self._nodeSets = list(self.nodeSets)
+        self._elSets = list(self.elSets)
 
     @classmethod
     def setNumThreads(cls, numThreads: int):
@@ -283,13 +517,14 @@ class Simulation:
     def name(self):
         return self._name
 
-    def writeHeaders(self):
+    def writeHeaders(self, out) -> None:
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' INCLUDES ')
+        parts = [_HDR_INCLUDES]
 
         for filename in self.includes:
-            self._input += '*include,input={:s}'.format(filename)
+            parts.append('*include,input={:s}\n'.format(filename))
+
+        out.write(''.join(parts))
 
     def prepareConnectors(self):
         """
@@ -306,142 +541,172 @@ class Simulation:
 
             numConnectors += 1
 
-    def writeInput(self) -> str:
+    def writeInput(self, out=None) -> Optional[str]:
         """
-        Writes the input deck for the simulation
+        Writes the input deck for the simulation. The deck is streamed directly to the text stream if one is provided,
+        otherwise it is written to an in-memory buffer, stored and returned.
+
+        :param out: Text stream (e.g. an open file) to write the input deck to
+        :return: str: The input deck when no output stream is provided, otherwise None
         """
 
+        if out is None:
+            buf = io.StringIO()
+            self.writeInput(buf)
+            self._input = buf.getvalue()
+            return self._input
+
         self.init()
 
         self.prepareConnectors()
 
-        self.writeHeaders()
-        self.writeMesh()
-        self.writeNodeSets()
-        self.writeElementSets()
-        self.writeKinematicConnectors()
-        self.writeMPCs()
-        self.writeMaterials()
-        self.writeMaterialAssignments()
-        self.writeInitialConditions()
-        self.writeAnalysisConditions()
-        self.writeLoadSteps()
+        self.writeHeaders(out)
+        self.writeMesh(out)
+        self.writeNodeSets(out)
+        self.writeElementSets(out)
+        self.writeKinematicConnectors(out)
+        self.writeMPCs(out)
+        self.writeMaterials(out)
+        self.writeMaterialAssignments(out)
+        self.writeInitialConditions(out)
+        self.writeAnalysisConditions(out)
+        self.writeLoadSteps(out)
 
-        return self._input
-
-    def writeElementSets(self):
+    def writeElementSets(self, out) -> None:
 
         if len(self._elSets) == 0:
             return
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' ELEMENT SETS ')
-
-        for elSet in self._elSets:
-            self._input += os.linesep
-            self._input += elSet.writeInput()
+        out.write(_HDR_ELEMENT_SETS)
 
-            #self._input += '*ELSET,ELSET={:s\n}'.format(elSet['name'])
-            #self._input += np.array2string(elSet['els'], precision=2, separator=', ', threshold=9999999999)[1:-1]
+        _writeSets(out, self._elSets, ElementSet, lambda elSet: elSet.els)
 
-    def writeNodeSets(self):
+    def writeNodeSets(self, out) -> None:
 
         if len(self._nodeSets) == 0:
             return
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' NODE SETS ')
+        out.write(_HDR_NODE_SETS)
 
-        for nodeSet in self._nodeSets:
-            self._input += os.linesep
-            self._input += nodeSet.writeInput()
-            #self._input += '*NSET,NSET={:s}\n'.format(nodeSet['name'])
-            #self._input += '*NSET,NSET={:s}\n'.format(nodeSet['name'])
-            #self._input += np.array2string(nodeSet['nodes'], precision=2, separator=', ', threshold=9999999999)[1:-1]
+        _writeSets(out, self._nodeSets, NodeSet, lambda nodeSet: nodeSet.nodes)
 
-    def writeKinematicConnectors(self):
+    def writeKinematicConnectors(self, out) -> None:
 
         if len(self.connectors) < 1:
             return
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' KINEMATIC CONNECTORS ')
+        out.write(_HDR_CONNECTORS)
 
         for connector in self.connectors:
 
             # A nodeset is automatically created from the name of the connector
-            self.input += connector.writeInput()
+            connector.writeInput(out)
 
-    def writeMPCs(self):
+    def writeMPCs(self, out) -> None:
 
         if len(self.mpcSets) < 1:
             return
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' MPCS ')
+        out.write(_HDR_MPCS)
 
         for mpcSet in self.mpcSets:
-            self.input += '*EQUATION\n'
-            self.input += '{:d}\n'.format(len(mpcSet['numTerms']))  # Assume each line constrains two nodes and one dof
-            for mpc in mpcSet['equations']:
-                for i in range(len(mpc['eqn'])):
-                    self._input += '{:d},{:d},{:d}'.format(mpc['node'][i], mpc['dof'][i], mpc['eqn'][i])
+            out.write('*EQUATION\n')
 
-                self.input += os.linesep
+            # Consecutive equations with the same number of terms are stacked into a single array and written in one
+            # pass, preserving the order of the equations
+            for numTerms, mpcs in itertools.groupby(mpcSet['equations'], key=lambda mpc: len(mpc['eqn'])):
+                mpcs = list(mpcs)
+                nodes = np.array([mpc['node'] for mpc in mpcs], dtype=float)
+                dofs = np.array([mpc['dof'] for mpc in mpcs], dtype=float)
+                coeffs = np.array([mpc['eqn'] for mpc in mpcs], dtype=float)
+
+                # Interleave each term as (node, dof, coefficient) with a row per equation
+                terms = np.stack([nodes, dofs, coeffs], axis=2).reshape(len(mpcs), 3 * numTerms)
+                np.savetxt(out, terms, fmt=_equationFormat(numTerms))
 
     #        *EQUATION
     #        2 # number of terms in equation # typically two
     #        28,2,1.,22,2,-1. # node a id, dof, node b id, dof b
 
-    def writeMaterialAssignments(self):
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' MATERIAL ASSIGNMENTS ')
+    def writeMaterialAssignments(self, out) -> None:
+        parts = [_HDR_MATERIAL_ASSIGNMENTS]
+
+        sectionFmt = '*solid section, elset={:s}, material={:s}\n'.format
 
         for matAssignment in self.materialAssignments:
-            self._input += '*solid section, elset={:s}, material={:s}\n'.format(matAssignment[0], matAssignment[1])
+            parts.append(sectionFmt(matAssignment[0], matAssignment[1]))
 
-    def writeMaterials(self):
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' MATERIALS ')
-        for material in self.materials:
-            self._input += material.writeInput()
+        out.write(''.join(parts))
+
+    def writeMaterials(self, out) -> None:
+        out.write(_HDR_MATERIALS)
+
+        # Material cards are only regenerated if a material has been added, removed or modified since the last write
+        materialsKey = tuple((material, material.version) for material in self.materials)
+
+        if materialsKey != self._materialsCacheKey:
+            buf = io.StringIO()
+
+            for material in self.materials:
+                material.writeInput(buf)
+
+            self._materialsCache = buf.getvalue()
+            self._materialsCacheKey = materialsKey
+
+        out.write(self._materialsCache)
+
+    def writeInitialConditions(self, out) -> None:
+        out.write(_HDR_INITIAL_CONDITIONS)
 
-    def writeInitialConditions(self):
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' INITIAL CONDITIONS ')
+        initCondFmt = ('*INITIAL CONDITIONS,TYPE={:s}\n{:s},{:e}\n' + os.linesep).format
 
         for initCond in self.initialConditions:
-            self._input += '*INITIAL CONDITIONS,TYPE={:s}\n'.format(initCond['type'].upper())
-            self._input += '{:s},{:e}\n'.format(initCond['set'], initCond['value'])
-            self._input += os.linesep
+            out.write(initCondFmt(initCond['type'].upper(), initCond['set'], initCond['value']))
 
         # Write the Physical Constants
-        self._input += '*PHYSICAL CONSTANTS,ABSOLUTE ZERO={:e},STEFAN BOLTZMANN={:e}\n'.format(self.TZERO, self.SIGMAB)
+        out.write('*PHYSICAL CONSTANTS,ABSOLUTE ZERO={:e},STEFAN BOLTZMANN={:e}\n'.format(self.TZERO, self.SIGMAB))
 
-    def writeAnalysisConditions(self):
+    def writeAnalysisConditions(self, out) -> None:
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' ANALYSIS CONDITIONS ')
+        parts = [_HDR_ANALYSIS_CONDITIONS]
 
         # Write the Initial Timestep
-        self._input += '{:.3f}, {:.3f}\n'.format(self.initialTimeStep, self.defaultTimeStep)
+        parts.append('{:.3f}, {:.3f}\n'.format(self.initialTimeStep, self.defaultTimeStep))
 
-    def writeLoadSteps(self):
+        out.write(''.join(parts))
 
-        self._input += os.linesep
-        self._input += '{:*^125}\n'.format(' LOAD STEPS ')
+    def writeLoadSteps(self, out) -> None:
+
+        out.write(_HDR_LOAD_STEPS)
 
         for loadCase in self.loadCases:
-            self._input += loadCase.writeInput()
+            loadCase.writeInput(out)
 
-    def writeMesh(self):
+    def writeMesh(self, out) -> None:
 
         # TODO make a unique auto-generated name for the mesh
         meshFilename = 'mesh.inp'
         meshPath= os.path.join(self._workingDirectory, meshFilename)
 
-        self.model.writeMesh(meshPath)
-        self._input += '*include,input={:s}'.format(meshFilename)
+        # The mesh is only re-written if the model or its mesh has changed since it was previously written
+        meshKey = (self.model, self.model.meshRevision, meshPath)
+
+        # The file must also be unchanged since this analysis wrote it, as it may be shared with another analysis
+        absMeshPath = os.path.abspath(meshPath)
+
+        isMeshCurrent = (meshKey == self._meshCacheKey
+                         and _meshFileOwners.get(absMeshPath) is self._meshCacheKey
+                         and _fileState(absMeshPath) == self._meshFileState)
+
+        if not isMeshCurrent:
+            # GMSH writes the nodes and elements natively in the Calculix format, which is referenced using *include
+            self.model.writeMesh(meshPath)
+
+            self._meshCacheKey = meshKey
+            self._meshFileState = _fileState(absMeshPath)
+            _meshFileOwners[absMeshPath] = meshKey
+
+        out.write('*include,input={:s}'.format(meshFilename))
 
     def checkAnalysis(self) -> bool:
         """
@@ -454,17 +719,24 @@ class Simulation:
         if len(self.materials) == 0:
             raise AnalysisError('No material models have been assigned to the analysis')
 
+        # Materials are only re-validated if they have been added, removed or modified since the last successful check
+        materialsKey = tuple((material, material.version) for material in self.materials)
+
+        if materialsKey == self._validMaterialsKey:
+            return True
+
         for material in self.materials:
             if not material.isValid():
                 raise AnalysisError('Material ({:s}) is not valid'.format(material.name))
 
+        self._validMaterialsKey = materialsKey
 
         return True
 
     def version(self):
 
         if sys.platform == 'win32':
-            cmdPath = os.path.join(self.CALCULIX_PATH, 'ccx.exe ')
+            cmdPath = os.path.join(self.CALCULIX_PATH, 'ccx.exe')
             p = subprocess.Popen([cmdPath, '-v'], stdout=subprocess.PIPE, universal_newlines=True )
             stdout, stderr = p.communicate()
             version = re.search(r"(\d+).(\d+)", stdout)
@@ -514,6 +786,48 @@ class Simulation:
             pass
 
 
+    def _runCalculix(self, cmd) -> None:
+        """
+        Runs the Calculix process and waits for it to complete. When verbose output is enabled, the output is forwarded
+        to the console in blocks as it becomes available rather than line by line.
+
+        :param cmd: The command used to launch Calculix
+        :raise: subprocess.CalledProcessError: Calculix returned with an error
+        """
+
+        # An unset working directory refers to the current directory
+        cwd = self._workingDirectory or None
+
+        if not self.VERBOSE_OUTPUT:
+            return_code = subprocess.call(cmd, cwd=cwd, stdout=subprocess.DEVNULL)
+
+            if return_code:
+                raise subprocess.CalledProcessError(return_code, cmd)
+
+            return
+
+        popen = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, bufsize=1 << 16)
+
+        # Consoles without an underlying binary buffer (e.g. Jupyter) require the output to be decoded
+        console = getattr(sys.stdout, 'buffer', None)
+
+        if console is None:
+            def writeOutput(chunk):
+                sys.stdout.write(chunk.decode(errors='replace'))
+        else:
+            sys.stdout.flush()
+            writeOutput = console.write
+
+        # read1 returns any available output (up to the block size) without waiting for the block to fill
+        for chunk in iter(lambda: popen.stdout.read1(1 << 16), b''):
+            writeOutput(chunk)
+            sys.stdout.flush()
+
+        popen.stdout.close()
+        return_code = popen.wait()
+        if return_code:
+            raise subprocess.CalledProcessError(return_code, cmd)
+
     def run(self):
         """
         Performs pre-analysis checks on the model and submits the job for Calculix to perform.
@@ -526,11 +840,11 @@ class Simulation:
         self.checkAnalysis()
 
         print('{:=^60}\n'.format(' WRITING INPUT FILE '))
-        inputDeckContents = self.writeInput()
 
+        # Stream the input deck directly to disk rather than building it in memory
         inputDeckPath = os.path.join(self._workingDirectory,'input.inp')
-        with open(inputDeckPath, "w") as text_file:
-            text_file.write(inputDeckContents)
+        with open(inputDeckPath, "w", buffering=1 << 20) as text_file:
+            self.writeInput(text_file)
 
         # Set environment variables for performing multi-threaded
         os.environ["CCX_NPROC_STIFFNESS"] = '{:d}'.format(Simulation.NUMTHREADS)
@@ -540,21 +854,13 @@ class Simulation:
         print('\n{:=^60}\n'.format(' RUNNING CALCULIX '))
 
         if sys.platform == 'win32':
-            cmdPath = os.path.join(self.CALCULIX_PATH, 'ccx.exe ')
-            arguments = '-i input'
-
-            cmd = cmdPath + arguments
-
-            popen = subprocess.Popen(cmd, cwd=self._workingDirectory,  stdout=subprocess.PIPE, universal_newlines=True)
+            filename = 'input'
 
-            if self.VERBOSE_OUTPUT:
-                for stdout_line in iter(popen.stdout.readline, ""):
-                    print(stdout_line, end='')
+            # The executable and arguments are passed as a list so that paths containing spaces are handled
+            cmdPath = os.path.join(self.CALCULIX_PATH, 'ccx.exe')
+            cmd = [cmdPath, '-i', filename]
 
-            popen.stdout.close()
-            return_code = popen.wait()
-            if return_code:
-                raise subprocess.CalledProcessError(return_code, cmd)
+            self._runCalculix(cmd)
 
             # Analysis was completed successfully
             self._analysisCompleted = True
@@ -565,16 +871,7 @@ class Simulation:
 
             cmdSt = ['ccx', '-i', filename]
 
-            popen = subprocess.Popen(cmdSt, cwd=self._workingDirectory, stdout=subprocess.PIPE, universal_newlines=True)
-
-            if self.VERBOSE_OUTPUT:
-                for stdout_line in iter(popen.stdout.readline, ""):
-                    print(stdout_line, end='')
-
-            popen.stdout.close()
-            return_code = popen.wait()
-            if return_code:
-                raise subprocess.CalledProcessError(return_code, cmdSt)
+            self._runCalculix(cmdSt)
 
             # Analysis was completed successfully
             self._analysisCompleted = True
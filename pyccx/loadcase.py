@@ -93,99 +93,105 @@ class LoadCase:
 
         :return: outStr
         """
-        bcondStr = ''
+        parts = []
+
+        # Face based boundary conditions are written per face, so the format templates are bound once
+        faceFmt3 = '{:d},{:s}{:d},{:e}\n'.format
+        faceFmt4 = '{:d},{:s}{:d},{:e},{:e}\n'.format
 
         for bcond in self.boundaryConditions:
 
             if bcond['type'] == 'film':
 
-                bcondStr += '*FILM\n'
-                bfaces = bcond['faces']
-                for i in len(bfaces):
-                    bcondStr += '{:d},F{:d},{:e},{:e}\n'.format(bfaces[i, 0], bfaces[i, 1], bcond['tsink'], bcond['h'])
+                parts.append('*FILM\n')
+                tsink, h = bcond['tsink'], bcond['h']
+                for elId, faceId in np.asarray(bcond['faces'])[:, :2].tolist():
+                    parts.append(faceFmt4(elId, 'F', faceId, tsink, h))
 
             elif bcond['type'] == 'bodyflux':
 
-                bcondStr += '*DFLUX\n'
-                bcondStr += '{:s},BF,{:e}\n'.format(bcond['el'], bcond['flux'])  # use element set
+                parts.append('*DFLUX\n')
+                parts.append('{:s},BF,{:e}\n'.format(bcond['el'], bcond['flux']))  # use element set
 
             elif bcond['type'] == 'faceflux':
 
-                bcondStr += '*DFLUX\n'
-                bfaces = bcond['faces']
-                for i in range(len(bfaces)):
-                    bcondStr += '{:d},S{:d},{:e}\n'.format(bfaces[i, 0], bfaces[i, 1], bcond['flux'])
+                parts.append('*DFLUX\n')
+                flux = bcond['flux']
+                for elId, faceId in np.asarray(bcond['faces'])[:, :2].tolist():
+                    parts.append(faceFmt3(elId, 'S', faceId, flux))
 
             elif bcond['type'] == 'radiation':
 
-                bcondStr += '*RADIATE\n'
-                bfaces = bcond['faces']
-                for i in len(bfaces):
-                    bcondStr += '{:d},F{:d},{:e},{:e}\n'.format(bfaces[i, 0], bfaces[i, 1], bcond['tsink'],
-                                                           bcond['emmisivity'])
+                parts.append('*RADIATE\n')
+                tsink, emmisivity = bcond['tsink'], bcond['emmisivity']
+                for elId, faceId in np.asarray(bcond['faces'])[:, :2].tolist():
+                    parts.append(faceFmt4(elId, 'F', faceId, tsink, emmisivity))
 
             elif bcond['type'] == 'fixed':
 
-                bcondStr += '*BOUNDARY\n'
+                parts.append('*BOUNDARY\n')
                 nodeset = bcond['nodes']
                 # 1-3 U, 4-6, rotational DOF, 11 = Temp
 
                 for i in range(len(bcond['dof'])):
                     if 'value' in bcond.keys():
-                        bcondStr += '{:s},{:d},,{:e}\n'.format(nodeset, bcond['dof'][i],
-                                                           bcond['value'][i])  # inhomogenous boundary conditions
+                        parts.append('{:s},{:d},,{:e}\n'.format(nodeset, bcond['dof'][i],
+                                                                bcond['value'][i]))  # inhomogenous boundary conditions
                     else:
-                        bcondStr += '{:s},{:d}\n'.format(nodeset, bcond['dof'][i])
+                        parts.append('{:s},{:d}\n'.format(nodeset, bcond['dof'][i]))
 
             elif bcond['type'] == 'accel':
 
-                bcondStr += '*DLOAD\n'
-                bcondStr += '{:s},GRAV,{:.3f}, {:.3f},{:.3f},{:.3f}\n'.format(bcond['el'], bcond['mag'], bcond['dir'][0],
-                                                                       bcond['dir'][1], bcond['dir'][2])
+                parts.append('*DLOAD\n')
+                parts.append('{:s},GRAV,{:.3f}, {:.3f},{:.3f},{:.3f}\n'.format(bcond['el'], bcond['mag'], bcond['dir'][0],
+                                                                              bcond['dir'][1], bcond['dir'][2]))
 
             elif bcond['type'] == 'force':
 
-                bcondStr += '*CLOAD\n'
+                parts.append('*CLOAD\n')
                 nodeset = bcond['nodes']
 
                 for i in bcond['dof']:
-                    bcondStr += '{:s},{:d}\n'.format(nodeset, i, bcond['mag'])
+                    parts.append('{:s},{:d}\n'.format(nodeset, i, bcond['mag']))
 
             elif bcond['type'] == 'pressure':
 
-                bcondStr += '*DLOAD\n'
-                bfaces = bcond['faces']
-                for i in range(len(bfaces)):
-                    bcondStr += '{:d},P{:d},{:e}\n'.format(bfaces[i, 0], bfaces[i, 1], bcond['mag'])
+                parts.append('*DLOAD\n')
+                mag = bcond['mag']
+                for elId, faceId in np.asarray(bcond['faces'])[:, :2].tolist():
+                    parts.append(faceFmt3(elId, 'P', faceId, mag))
 
-        return bcondStr
+        return ''.join(parts)
 
-    def writeInput(self) -> str:
+    def writeInput(self, out) -> None:
+        """
+        Writes the load case step to the text stream
 
-        outStr  = '{:*^64}\n'.format(' LOAD CASE ({:s}) '.format(self.name))
-        outStr += '*STEP\n'
+        :param out: Text stream to write to
+        """
+
+        out.write('{:*^64}\n'.format(' LOAD CASE ({:s}) '.format(self.name)))
+        out.write('*STEP\n')
         # Write the thermal analysis loadstep
 
         if self.loadCaseType == LoadCaseType.STATIC:
-            outStr += '*STATIC'
+            out.write('*STATIC')
         elif self.loadCaseType == LoadCaseType.THERMAL:
-            outStr += '*HEAT TRANSFER'
+            out.write('*HEAT TRANSFER')
         elif self.loadCaseType == LoadCaseType.UNCOUPLEDTHERMOMECHANICAL:
-            outStr += '*UNCOUPLED TEMPERATURE-DISPLACEMENT'
+            out.write('*UNCOUPLED TEMPERATURE-DISPLACEMENT')
 
         if self.isSteadyState:
-            outStr += ', STEADY STATE'
+            out.write(', STEADY STATE')
 
         # Write the timestepping information
-        outStr += '\n{:.3f}, {:.3f}\n'.format(self.initialTimeStep, self.totalTime)
+        out.write('\n{:.3f}, {:.3f}\n'.format(self.initialTimeStep, self.totalTime))
 
         # Write the individual boundary conditions associated with this loadcase
-        outStr += self.writeBoundaryCondition()
+        out.write(self.writeBoundaryCondition())
 
-        outStr += os.linesep
+        out.write(os.linesep)
         for postResult in self.resultSet:
-            outStr += postResult.writeInput()
-
-        outStr += '*END STEP\n\n'
+            out.write(postResult.writeInput())
 
-        return outStr
+        out.write('*END STEP\n\n')
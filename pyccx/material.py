@@ -9,10 +9,26 @@ class Material(abc.ABC):
     MATERIALMODEL = 'INVALID'
 
     def __init__(self, name):
+        self._version = 0
         self._input = ''
         self._name = name
         self._materialModel = ''
 
+    def __setattr__(self, key, value):
+        super().__setattr__(key, value)
+
+        # Any change to the material's attributes invalidates previously generated input
+        if key != '_version':
+            super().__setattr__('_version', getattr(self, '_version', 0) + 1)
+
+    @property
+    def version(self) -> int:
+        """
+        A counter incremented whenever an attribute of the material is assigned. Note: in-place modification of
+        array values (e.g. the hardening curve) is not tracked and requires the attribute to be re-assigned.
+        """
+        return self._version
+
     @property
     def name(self) -> str:
         return self._name
@@ -26,7 +42,10 @@ class Material(abc.ABC):
         raise NotImplementedError()
 
     @abc.abstractmethod
-    def writeInput(self):
+    def writeInput(self, out) -> None:
+        """
+        Abstract method: re-implement in material models to write the material definition to the text stream
+        """
         raise NotImplemented()
 
     @abc.abstractmethod
@@ -180,7 +199,7 @@ class ElastoPlasticMaterial(Material):
 
     def writeElasticProp(self) -> str:
 
-        lineStr = '*elastic'
+        parts = ['*elastic']
         nu = self.cast2Numpy(self.nu)
         E = self.cast2Numpy(self.E)
 
@@ -191,17 +210,17 @@ class ElastoPlasticMaterial(Material):
             if nu.shape[0] != E.shape[0]:
                 raise ValueError("Same number of entries must exist for Poissons ratio and Young' Modulus")
 
-            lineStr += ',type=iso\n'
+            parts.append(',type=iso\n')
             if nu.ndim == 1:
-                lineStr += '{:e},{:e}\n'.format(E[0], nu[0])
+                parts.append('{:e},{:e}\n'.format(E[0], nu[0]))
             elif nu.ndim == 2:
                 for i in range(nu.shape[0]):
-                    lineStr += '{:e},{:e},{:e}\n'.format(E[i, 1], nu[i, 1], E[0])
+                    parts.append('{:e},{:e},{:e}\n'.format(E[i, 1], nu[i, 1], E[0]))
         else:
             raise ValueError('Not currently support elastic mode')
 
 
-        return lineStr
+        return ''.join(parts)
 
     def writePlasticProp(self):
 
@@ -211,18 +230,20 @@ class ElastoPlasticMaterial(Material):
         if self.isPlastic() and self.hardeningCurve is None:
             raise ValueError('Plasticity requires a work hardening curve to be defined')
 
-        lineStr = ''
+        parts = []
         if self._workHardeningMode is ElastoPlasticMaterial.WorkHardeningType.ISOTROPIC:
-            lineStr += '*plastic HARDENING=ISOTROPIC\n'
+            parts.append('*plastic HARDENING=ISOTROPIC\n')
         elif self._workHardeningMode is ElastoPlasticMaterial.WorkHardeningType.KINEMATIC:
-            lineStr += '*plastic HARDENING=KINEMATIC\n'
+            parts.append('*plastic HARDENING=KINEMATIC\n')
         elif self._workHardeningMode is ElastoPlasticMaterial.WorkHardeningType.COMBINED:
-            lineStr += '*cyclic hardening HARDENING=COMBINED\n'
+            parts.append('*cyclic hardening HARDENING=COMBINED\n')
 
         for i in range(self.hardeningCurve.shape[0]):
-            lineStr += '{:e},{:e},{:e}\n'.format(self._hardeningCurve[i, 0], # Stress
-                                                 self._hardeningCurve[i, 1], # Plastic Strain
-                                                 self._hardeningCurve[i, 2]) # Temperature
+            parts.append('{:e},{:e},{:e}\n'.format(self._hardeningCurve[i, 0], # Stress
+                                                   self._hardeningCurve[i, 1], # Plastic Strain
+                                                   self._hardeningCurve[i, 2])) # Temperature
+
+        return ''.join(parts)
 
     def writeMaterialProp(self, matPropName: str, tempVals) -> str:
         """
@@ -243,53 +264,51 @@ class ElastoPlasticMaterial(Material):
         else:
             raise ValueError('Material prop type not supported')
 
-        lineStr = '*{:s}'.format(matPropName)
+        parts = ['*{:s}'.format(matPropName)]
 
         if (tempVal.ndim == 1 and tempVal.shape[0] == 1) or (tempVal.ndim == 2 and tempVal.shape[1] == 1):
-            lineStr += ',type=iso\n'
+            parts.append(',type=iso\n')
         elif (tempVal.ndim == 1 and tempVal.shape[0] == 3) or (tempVal.ndim == 2 and tempVal.shape[1] == 4):
-            lineStr += ',type=ortho\n'
+            parts.append(',type=ortho\n')
         else:
             raise ValueError('Invalid mat property({:s}'.format(matPropName))
 
         if tempVal.ndim == 1:
             if tempVal.shape[0] == 1:
-                lineStr += '{:e}\n'.format(tempVal[0])
+                parts.append('{:e}\n'.format(tempVal[0]))
             elif tempVal.shape[0] == 3:
-                lineStr += '{:e},{:e},{:e}\n'.format(tempVal[0], tempVal[1], tempVal[2])
+                parts.append('{:e},{:e},{:e}\n'.format(tempVal[0], tempVal[1], tempVal[2]))
 
         if tempVal.ndim == 2:
             for i in range(tempVal.shape[0]):
                 if tempVal.shape[1] == 2:
-                    lineStr += '{:e},{:e}\n'.format(tempVal[i, 1], tempVal[i, 0])
+                    parts.append('{:e},{:e}\n'.format(tempVal[i, 1], tempVal[i, 0]))
                 elif tempVal.shape[1] == 4:
-                    lineStr += '{:e},{:e},{:e},{:e}\n'.format(tempVal[1], tempVal[2], tempVal[3], tempVal[0])
+                    parts.append('{:e},{:e},{:e},{:e}\n'.format(tempVal[1], tempVal[2], tempVal[3], tempVal[0]))
 
-        return lineStr
+        return ''.join(parts)
 
     def isValid(self) -> bool:
         return True
 
-    def writeInput(self) -> str:
+    def writeInput(self, out) -> None:
 
-        inputStr = '*material, name={:s}\n'.format(self._name)
-        inputStr += '*{:s}\n'.format(self.materialModel)
+        out.write('*material, name={:s}\n'.format(self._name))
+        out.write('*{:s}\n'.format(self.materialModel))
 
-        inputStr += self.writeElasticProp()
+        out.write(self.writeElasticProp())
 
         if self.density:
-            inputStr += self.writeMaterialProp('density', self.density)
+            out.write(self.writeMaterialProp('density', self.density))
 
         if self.cp:
-            inputStr += self.writeMaterialProp('specific heat', self.cp)
+            out.write(self.writeMaterialProp('specific heat', self.cp))
 
         if self.alpha_CTE:
-            inputStr += self.writeMaterialProp('expansion', self.alpha_CTE)
+            out.write(self.writeMaterialProp('expansion', self.alpha_CTE))
 
         if self.k:
-            inputStr += self.writeMaterialProp('conductivity', self.k)
+            out.write(self.writeMaterialProp('conductivity', self.k))
 
         # Write the plastic mode
-        inputStr += self.writePlasticProp()
-
-        return inputStr
+        out.write(self.writePlasticProp())
@@ -80,7 +80,7 @@ class ElementType:
         id = 6
         name = 'C3D6'
         nodes = 6
-        faces = np.array([[1,2,3], [4,5,6], [1,2,5,4], [2,3,6,5], [3,1,4,6]])
+        faces = np.array([[1,2,3], [4,5,6], [1,2,5,4], [2,3,6,5], [3,1,4,6]], dtype=object)
 
 
 
@@ -118,6 +118,7 @@ class Mesher:
         self._isDirty = False # Flag to indicate model hasn't been generated and is dirty
         self._isGeometryDirty = False
         self._meshingAlgorithm = MeshingAlgorithm.DELAUNAY
+        self._meshRevision = 0 # Incremented whenever the mesh or its physical groups are modified
 
         # Set the model name for this instance
         gmsh.model.add(self._modelName)
@@ -181,6 +182,7 @@ class Mesher:
         maxId = self.maxPhysicalGroupId(3)
         gmsh.model.addPhysicalGroup(3, [volId],maxId+1)
         gmsh.model.setPhysicalName(3,volId, name)
+        self._meshRevision += 1
 
     def setSurfacePhysicalName(self, surfId: int, name: str) -> None:
         """
@@ -193,6 +195,7 @@ class Mesher:
         maxId = self.maxPhysicalGroupId(2)
         gmsh.model.addPhysicalGroup(2, [surfId],maxId+1)
         gmsh.model.setPhysicalName(2,surfId, name)
+        self._meshRevision += 1
 
     def setEntityPhysicalName(self, id, name: str) -> None:
         """
@@ -205,6 +208,7 @@ class Mesher:
         maxId = self.maxPhysicalGroupId(id[0])
         gmsh.model.addPhysicalGroup(id[0], [id[1]],maxId+1)
         gmsh.model.setPhysicalName(id[0], id[1], name)
+        self._meshRevision += 1
 
     def name(self) -> str:
         """
@@ -221,12 +225,23 @@ class Mesher:
 
     def setModelChanged(self, state : bool = False) -> None:
         """
-        Any changes to GMSH model should call this to prevent inconsistency in a generated model
+        Any changes to GMSH model should call this to prevent inconsistency in a generated model. This also
+        invalidates any mesh previously written from the model.
 
         :param state:  Force the model to be shown as generated
         """
 
         self._isDirty = state
+        self._meshRevision += 1
+
+    @property
+    def meshRevision(self) -> int:
+        """
+        A revision counter which is incremented whenever the mesh or the physical groups of the model are modified.
+        This may be used to check if a previously written mesh is still valid. Changes made directly through the GMSH
+        API (e.g. gmsh.model or gmsh.option) are not tracked and :meth:`setModelChanged` should be called afterwards.
+        """
+        return self._meshRevision
 
     def addGeometry(self, filename: str, name: str, meshFactor: float = 0.03):
         """
@@ -279,6 +294,7 @@ class Mesher:
         """
         self.setAsCurrentModel()
         gmsh.model.mesh.clear()
+        self._meshRevision += 1
 
     @property
     def volumes(self) -> List[int]:
@@ -858,6 +874,7 @@ class Mesher:
 
         self._isMeshGenerated = True
         self._isDirty = False
+        self._meshRevision += 1
 
     def isMeshGenerated(self) -> bool:
         """
@@ -867,7 +884,8 @@ class Mesher:
 
     def writeMesh(self, filename: str) -> None:
         """
-        Writes the generated mesh to the file
+        Writes the generated mesh to the file. The mesh is exported directly by GMSH's native writer, with the format
+        chosen from the file extension (e.g. '.inp' for the Abaqus/Calculix input format).
 
         :param filename: str - Filename (including the type) to save to.
         """
@@ -19,6 +19,10 @@ requirements_easy = set([
     'colorlog'])   # log in pretty colors
 
 
+# optional requirements for accelerating the writing of large input decks
+requirements_numba = set([
+    'numba'])
+
 # requirements for building documentation
 requirements_docs = set([
     'sphinx',
@@ -54,6 +58,7 @@ setup(
     packages=find_packages(exclude=('tests', 'docs')),
     install_requires=list(requirements_default),
     extras_require={'easy': list(requirements_easy),
+                    'numba': list(requirements_numba),
                     'docs': list(requirements_docs)}
 )
 
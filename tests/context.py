@@ -2,7 +2,29 @@
 
 import sys
 import os
-import pyccx
+import types
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+try:
+    import gmsh
+except (ImportError, OSError):
+    # The input deck writers do not require GMSH, so it is isolated when the GMSH library cannot be loaded
+    sys.modules['gmsh'] = types.ModuleType('gmsh')
+
+import pyccx
+
+
+class FakeMesher:
+    """
+    Stand-in for :class:`~pyccx.mesh.Mesher` which writes a placeholder mesh file and records the number of writes
+    """
+
+    def __init__(self):
+        self.meshRevision = 0
+        self.numWrites = 0
+
+    def writeMesh(self, filename: str) -> None:
+        self.numWrites += 1
 
+        with open(filename, 'w') as f:
+            f.write('*NODE\n1,0.0,0.0,0.0\n' * self.numWrites)
@@ -1,9 +1,18 @@
 # -*- coding: utf-8 -*-
-from .context import pyccx
+from .context import pyccx, FakeMesher
 
+import io
+import os
 import unittest
 import platform
 import tempfile
+from unittest import mock
+
+import numpy as np
+
+from pyccx.core import ElementSet, NodeSet, Simulation, _writeIntArray, _writeSets
+from pyccx.mesh import Mesher
+
 
 class AdvancedTestSuite(unittest.TestCase):
     """Advanced test cases."""
@@ -12,5 +21,120 @@ class AdvancedTestSuite(unittest.TestCase):
         assert True
 
 
+class MeshCacheTestSuite(unittest.TestCase):
+    """Test cases for re-using the mesh written between analyses."""
+
+    def setUp(self):
+        self._tempDir = tempfile.TemporaryDirectory()
+        self.workDir = self._tempDir.name
+        self.meshPath = os.path.join(self.workDir, 'mesh.inp')
+
+    def tearDown(self):
+        self._tempDir.cleanup()
+
+    def createAnalysis(self, model=None) -> Simulation:
+        analysis = Simulation(model if model else FakeMesher())
+        analysis.setWorkingDirectory(self.workDir)
+        return analysis
+
+    def test_unchangedMeshIsReused(self):
+        analysis = self.createAnalysis()
+        analysis.writeInput()
+        analysis.writeInput()
+
+        self.assertEqual(analysis.model.numWrites, 1)
+
+    def test_meshRevisionInvalidates(self):
+        analysis = self.createAnalysis()
+        analysis.writeInput()
+
+        analysis.model.meshRevision += 1
+        analysis.writeInput()
+
+        self.assertEqual(analysis.model.numWrites, 2)
+
+    def test_sharedWorkingDirectoryInvalidates(self):
+        analysisA = self.createAnalysis()
+        analysisB = self.createAnalysis()
+
+        analysisA.writeInput()
+        analysisB.writeInput()
+
+        # Analysis B overwrote the mesh file, so analysis A must write its own mesh again
+        analysisA.writeInput()
+
+        self.assertEqual(analysisA.model.numWrites, 2)
+        self.assertEqual(analysisB.model.numWrites, 1)
+
+    def test_modifiedMeshFileInvalidates(self):
+        analysis = self.createAnalysis()
+        analysis.writeInput()
+
+        with open(self.meshPath, 'a') as f:
+            f.write('** modified\n')
+
+        analysis.writeInput()
+        self.assertEqual(analysis.model.numWrites, 2)
+
+    def test_removedMeshFileInvalidates(self):
+        analysis = self.createAnalysis()
+        analysis.writeInput()
+
+        os.remove(self.meshPath)
+
+        analysis.writeInput()
+        self.assertEqual(analysis.model.numWrites, 2)
+
+    @mock.patch('pyccx.mesh.mesher.gmsh')
+    def test_surfaceSetBumpsMeshRevision(self, gmshMock):
+        with mock.patch.object(Mesher, 'Initialised', True):
+            model = Mesher('model')
+
+        revision = model.meshRevision
+        model.setSurfaceSet(1, 'surface')
+
+        self.assertGreater(model.meshRevision, revision)
+
+
+@unittest.skipUnless(pyccx.core._HAS_NUMBA, 'numba is not installed')
+class NumbaWriterTestSuite(unittest.TestCase):
+    """Test cases comparing the numba formatting kernel against the savetxt path."""
+
+    def writeIntArray(self, arr):
+        out = io.StringIO()
+        _writeIntArray(out, arr)
+        return out.getvalue()
+
+    def writeSets(self, sets, baseCls, ids):
+        out = io.StringIO()
+        _writeSets(out, sets, baseCls, ids)
+        return out.getvalue()
+
+    def test_intArray(self):
+        for size in [100000, 100001, 100015, 250007]:
+            with self.subTest(size=size):
+                arr = np.arange(-size // 2, size - size // 2) * 7919
+
+                value = self.writeIntArray(arr)
+
+                with mock.patch('pyccx.core._HAS_NUMBA', False):
+                    self.assertEqual(value, self.writeIntArray(arr))
+
+    def test_packedSets(self):
+        nodeSets = [NodeSet('a', np.arange(1, 100016)),
+                    NodeSet('empty', np.array([], dtype=int)),
+                    NodeSet('b', np.arange(5, 150000, 3))]
+
+        elSets = [ElementSet('c', np.arange(1, 17)),
+                  ElementSet('d', np.arange(1, 250008))]
+
+        nodeValue = self.writeSets(nodeSets, NodeSet, lambda nodeSet: nodeSet.nodes)
+        elValue = self.writeSets(elSets, ElementSet, lambda elSet: elSet.els)
+
+        with mock.patch('pyccx.core._HAS_NUMBA', False):
+            self.assertEqual(nodeValue, self.writeSets(nodeSets, NodeSet, lambda nodeSet: nodeSet.nodes))
+            self.assertEqual(elValue, self.writeSets(elSets, ElementSet, lambda elSet: elSet.els))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,10 +1,15 @@
 # -*- coding: utf-8 -*-
-from .context import pyccx
+from .context import pyccx, FakeMesher
 
+import io
 import unittest
 import platform
 import tempfile
 
+import numpy as np
+
+from pyccx.core import Connector, ElementSet, NodeSet, Simulation, SurfaceSet, _equationFormat
+
 
 class BasicTestSuite(unittest.TestCase):
     """Basic test cases."""
@@ -13,5 +18,128 @@ class BasicTestSuite(unittest.TestCase):
         assert True
 
 
+class SetWriterTestSuite(unittest.TestCase):
+    """Test cases for writing the node, element and surface sets."""
+
+    def test_nodeSetLines(self):
+        out = io.StringIO()
+        NodeSet('nodes', np.arange(1, 20)).writeInput(out)
+
+        self.assertEqual(out.getvalue(), '*NSET,NSET=nodes\n'
+                                         '1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16\n'
+                                         '17,18,19\n')
+
+    def test_elementSetHeader(self):
+        out = io.StringIO()
+        ElementSet('els', np.array([4, 5, 6])).writeInput(out)
+
+        self.assertEqual(out.getvalue(), '*ELSET,ELSET=els\n4,5,6\n')
+
+    def test_simulationSets(self):
+
+        class TaggedNodeSet(NodeSet):
+            def writeInput(self, out) -> None:
+                out.write('** Tagged\n')
+                super().writeInput(out)
+
+        analysis = Simulation(FakeMesher())
+        analysis.nodeSets = [NodeSet('a', np.array([1, 2])), TaggedNodeSet('b', np.array([3]))]
+        analysis.elSets = [ElementSet('els', np.array([4, 5]))]
+        analysis.init()
+
+        out = io.StringIO()
+        analysis.writeNodeSets(out)
+        analysis.writeElementSets(out)
+        value = out.getvalue()
+
+        # Overridden set writers are used when writing the input deck
+        self.assertIn('\n*NSET,NSET=a\n1,2\n', value)
+        self.assertIn('\n** Tagged\n*NSET,NSET=b\n3\n', value)
+        self.assertIn('\n*ELSET,ELSET=els\n4,5\n', value)
+
+    def test_surfaceSetPairs(self):
+        pairs = np.array([[1, 2], [3, 4]])
+        surfSet = SurfaceSet('surf', pairs)
+        self.assertIs(surfSet.surfacePairs, pairs)
+
+        surfSet.surfacePairs = np.array([[7, 1]])
+
+        out = io.StringIO()
+        surfSet.writeInput(out)
+        self.assertEqual(out.getvalue(), '*SURFACE,NAME=surf\n7,S1\n')
+
+
+class ConnectorTestSuite(unittest.TestCase):
+    """Test cases for the kinematic connectors."""
+
+    def test_connectorNodes(self):
+        connector = Connector('c1', [1, 2, 3])
+
+        self.assertEqual(connector.nodeset.name, 'Connecter_c1')
+        np.testing.assert_array_equal(connector.nodeset.nodes, [1, 2, 3])
+
+    def test_connectorRefNode(self):
+        out = io.StringIO()
+        Connector('c1', [1, 2, 3], refNode=5).writeInput(out)
+        self.assertEqual(out.getvalue(), '*RIGIDBODY, NSET=Connecter_c1,REF NODE=5\n')
+
+        out = io.StringIO()
+        Connector('c1', [1, 2, 3]).writeInput(out)
+        self.assertEqual(out.getvalue(), '*RIGIDBODY, NSET=Connecter_c1\n')
+
+    def test_repeatedWriteInput(self):
+        analysis = Simulation(FakeMesher())
+
+        with tempfile.TemporaryDirectory() as workDir:
+            analysis.setWorkingDirectory(workDir)
+            analysis.nodeSets.append(NodeSet('nodes', np.arange(1, 5)))
+            analysis.connectors.append(Connector('c1', [1, 2, 3]))
+
+            first = analysis.writeInput()
+            second = analysis.writeInput()
+
+        # The connector's node set is written once and is not added to the user's node sets
+        self.assertEqual(first, second)
+        self.assertEqual(first.count('*NSET,NSET=Connecter_c1\n'), 1)
+        self.assertEqual(len(analysis.nodeSets), 1)
+
+
+class EquationWriterTestSuite(unittest.TestCase):
+    """Test cases for writing the MPC equations."""
+
+    def test_equationFormatWrapping(self):
+        self.assertEqual(_equationFormat(2), '2\n%d,%d,%e,%d,%d,%e')
+
+        # A maximum of 4 terms (12 entries) are written per line
+        fmt = _equationFormat(6)
+        lines = fmt.split('\n')
+
+        self.assertEqual(lines[0], '6')
+        self.assertEqual(lines[1], ','.join(['%d,%d,%e'] * 4))
+        self.assertEqual(lines[2], ','.join(['%d,%d,%e'] * 2))
+
+    def test_equationOrder(self):
+        analysis = Simulation(FakeMesher())
+
+        def equation(numTerms, node):
+            return {'node': [node] * numTerms, 'dof': [1] * numTerms, 'eqn': [1.0] * numTerms}
+
+        analysis.mpcSets.append({'equations': [equation(2, 1), equation(5, 2), equation(2, 3)]})
+
+        out = io.StringIO()
+        analysis.writeMPCs(out)
+        lines = out.getvalue().split('*EQUATION\n')[1].splitlines()
+
+        # Each equation is preceded by its number of terms and the original order is kept
+        self.assertEqual(lines[0], '2')
+        self.assertTrue(lines[1].startswith('1,1,'))
+        self.assertEqual(lines[2], '5')
+        self.assertTrue(lines[3].startswith('2,1,'))
+        self.assertTrue(lines[4].startswith('2,1,'))
+        self.assertEqual(lines[5], '2')
+        self.assertTrue(lines[6].startswith('3,1,'))
+        self.assertEqual(len(lines), 7)
+
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()